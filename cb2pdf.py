@@ -1,23 +1,46 @@
+import contextlib
+import gc
+import io
 import os
 import shutil
 import zipfile
 import tempfile
 import logging
-import gc
+import logging.handlers
+import mmap
+import multiprocessing
+import platform
+import struct
 import sys
+from collections.abc import Iterator
+from typing import BinaryIO
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 
 # External libraries required
 try:
 	import rarfile
 	import img2pdf
-	from natsort import natsorted
+	from natsort import natsort_keygen
+	import PIL
 	from PIL import Image
 	from tqdm import tqdm
 except ImportError:
 	print("ERROR: Missing dependencies.")
 	print("Please install them using: pip install img2pdf natsort rarfile pillow tqdm")
+	if platform.machine() in ('x86_64', 'AMD64'):
+		print("On x86-64 CPUs, Pillow-SIMD is a faster drop-in replacement for Pillow: pip install pillow-simd")
+		print("(For AVX2 support, build it with: CC=\"cc -mavx2\" pip install pillow-simd)")
 	exit(1)
 
+# Optional library: a compiled kernel speeds up flattening transparent pages
+try:
+	import numpy as np
+	from numba import njit
+	NUMBA_AVAILABLE = True
+except ImportError:
+	NUMBA_AVAILABLE = False
+
 # --- Configuration ---
 if getattr(sys, 'frozen', False):
 	# If running as a bundled executable (PyInstaller)
@@ -28,16 +51,22 @@ else:
 OLD_DIR = os.path.join(CURRENT_DIR, 'old_files')
 LOG_FILE = os.path.join(CURRENT_DIR, 'conversion_error_log.txt')
 
-# Tuple of allowed image extensions (Tuple is strictly required by the .endswith() string method)
-IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.bmp', '.tiff', '.gif')
+# Set of allowed image extensions (lowercase, matched against the text after the last dot)
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.webp', '.bmp', '.tiff', '.gif'})
 
 # Define a bounding box (Width, Height) to avoid excessively large images.
 # 2560x2560 allows standard pages and horizontal spreads to scale down cleanly 
 # without breaking the aspect ratio.
 MAX_IMAGE_SIZE = (2560, 2560)
 
-# System directories to ignore to prevent errors with hidden metadata files
-IGNORED_FOLDERS = ('__MACOSX', '.git', '.ds_store')
+# Natural sort key (e.g., page_2.jpg before page_10.jpg), built once instead of on every sort
+NATSORT_KEY = natsort_keygen()
+
+# JPEG Start Of Frame markers, which carry the image dimensions (0xC4, 0xC8 and 0xCC share the range but are not frames)
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# System directories to ignore to prevent errors with hidden metadata files (lowercase, matched case-insensitively)
+IGNORED_FOLDERS = frozenset({'__macosx', '.git', '.ds_store'})
 
 # --- UnRAR Configuration for cross-platform support ---
 # First, tries to find unrar in the system's global PATH (Linux, macOS, and configured Windows)
@@ -60,19 +89,25 @@ else:
 			unrar_found = True
 			break
 			
-	if not unrar_found:
+	# Worker processes re-import this module on spawn-based platforms, so only the parent warns
+	if not unrar_found and multiprocessing.current_process().name == 'MainProcess':
 		print("WARNING: UnRAR.exe could not be found in the system.")
 		print("Make sure WinRAR is installed or place UnRAR.exe inside the script's directory.")
 
 
 # --- Log Setup ---
-logging.basicConfig(
-	filename=LOG_FILE,
-	level=logging.INFO,
-	format='%(asctime)s - %(levelname)s - %(message)s',
+# Archives are processed in parallel worker processes, so records are funneled through a
+# queue and written to the log file by a single listener living in the main process.
+LOG_FORMATTER = logging.Formatter(
+	fmt='%(asctime)s - %(levelname)s - %(message)s',
 	datefmt='%Y-%m-%d %H:%M:%S'
 )
 
+# Threads available for the per-page work of a single archive.
+# This value is only a placeholder: init_worker() overwrites it in every worker process with
+# the share of the CPU cores computed by run_process_pool(), and the pages are never processed elsewhere.
+THREAD_COUNT = min(8, os.cpu_count() or 1)
+
 
 # --- Functions ---
 
@@ -82,15 +117,47 @@ def log_msg(msg: str, msg_type: str = 'info') -> None:
 	
 	Args:
 		msg (str): The message content to be logged.
-		msg_type (str): The severity level of the log ('info' or 'error').
+		msg_type (str): The severity level of the log ('info', 'warning' or 'error').
 	"""
 	print(msg)
 	if msg_type == 'info':
 		logging.info(msg)
+	elif msg_type == 'warning':
+		logging.warning(msg)
 	elif msg_type == 'error':
 		logging.error(msg)
 
 
+def setup_logging(log_queue) -> None:
+	"""
+	Routes every log record of the current process to the shared log queue.
+	
+	Args:
+		log_queue (multiprocessing.Queue): The queue consumed by the log file listener.
+	"""
+	root_logger = logging.getLogger()
+	root_logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+	root_logger.setLevel(logging.INFO)
+
+
+def init_worker(log_queue, thread_count: int) -> None:
+	"""
+	Initializer of the worker processes that convert the archives.
+	
+	Args:
+		log_queue (multiprocessing.Queue): The queue consumed by the log file listener.
+		thread_count (int): The number of threads this worker may use for each archive.
+	"""
+	global THREAD_COUNT
+	THREAD_COUNT = thread_count
+	
+	setup_logging(log_queue)
+	
+	# Everything imported so far lives for the whole process, so it is moved out of the
+	# garbage collector's reach instead of being rescanned on every collection
+	gc.freeze()
+
+
 def setup_folders() -> None:
 	"""
 	Creates the necessary output directories if they do not exist.
@@ -99,30 +166,153 @@ def setup_folders() -> None:
 		os.makedirs(OLD_DIR)
 
 
-def extract_files(file_path: str, destination_folder: str) -> bool:
+def check_pillow_simd() -> None:
+	"""
+	Suggests Pillow-SIMD on x86-64 machines still running the stock Pillow build.
+	Pillow-SIMD keeps the same API but vectorizes the resampling and color conversion
+	kernels (SSE4/AVX2), which dominate the time spent resizing the pages.
+	"""
+	# Bundled executables ship their own Pillow, so there is nothing the user could replace
+	if getattr(sys, 'frozen', False) or platform.machine() not in ('x86_64', 'AMD64'):
+		return
+	
+	# Pillow-SIMD releases are versioned as '<pillow version>.postN'
+	if '.post' not in PIL.__version__:
+		print("TIP: Install Pillow-SIMD to speed up image resizing: pip uninstall pillow && pip install pillow-simd")
+
+
+def is_image_file(file_name: str) -> bool:
 	"""
-	Extracts a CBZ or CBR archive into a specified destination directory.
+	Checks whether a file has a supported image extension and is not a '._' resource fork.
 	
 	Args:
-		file_path (str): The absolute path to the archive.
-		destination_folder (str): The path where the files should be extracted.
+		file_name (str): The file name (or archive member path) to be checked.
 		
 	Returns:
-		bool: True if the extraction was successful, False otherwise.
+		bool: True if the file should be treated as a page.
 	"""
-	try:
-		if file_path.lower().endswith('.cbz'):
-			with zipfile.ZipFile(file_path, 'r') as zf:
-				zf.extractall(destination_folder)
-			return True
-		elif file_path.lower().endswith('.cbr'):
-			with rarfile.RarFile(file_path, 'r') as rf:
-				rf.extractall(destination_folder)
-			return True
-	except Exception as e:
-		log_msg(f"  [ERROR] Failed extracting '{os.path.basename(file_path)}': {e}", 'error')
-		return False
-	return False
+	# Slicing from the last dot is cheaper than os.path.splitext(). Names without a dot
+	# yield their last character, which never matches an extension.
+	return file_name[file_name.rfind('.'):].lower() in IMAGE_EXTENSIONS and not file_name.startswith('._')
+
+
+def is_ignored_member(member_name: str) -> bool:
+	"""
+	Checks whether an archive member is hidden metadata that should never be read.
+	
+	Args:
+		member_name (str): The member path as stored inside the archive.
+		
+	Returns:
+		bool: True if the member is inside an ignored folder or is a '._' resource fork.
+	"""
+	parts = member_name.replace('\\', '/').split('/')
+	return parts[-1].startswith('._') or any(part.lower() in IGNORED_FOLDERS for part in parts[:-1])
+
+
+class SeekableMmap(mmap.mmap):
+	"""
+	A memory map usable as a regular read-only file object.
+	zipfile.ZipFile requires a seekable() method, which mmap objects lack.
+	"""
+	def seekable(self) -> bool:
+		return True
+
+
+@contextlib.contextmanager
+def open_archive_file(file_path: str) -> Iterator[BinaryIO]:
+	"""
+	Opens an archive for reading, memory-mapped on POSIX systems.
+	Reads are then served straight from the kernel page cache instead of going through
+	a read() system call each time. Other platforms fall back to a regular file.
+	
+	Args:
+		file_path (str): The absolute path to the archive.
+		
+	Yields:
+		BinaryIO: A seekable, read-only file object over the archive.
+	"""
+	with open(file_path, 'rb') as fp:
+		if os.name != 'posix':
+			yield fp
+			return
+		
+		with SeekableMmap(fp.fileno(), 0, prot=mmap.PROT_READ) as mapped:
+			yield mapped
+
+
+def iter_zip_images(file_path: str) -> Iterator[tuple[str, io.BytesIO]]:
+	"""
+	Streams the images of a CBZ archive straight into memory, without extracting them to disk.
+	
+	Args:
+		file_path (str): The absolute path to the archive.
+		
+	Yields:
+		tuple[str, io.BytesIO]: The image path inside the archive and its content, in natural order.
+	"""
+	# The archive is opened once, so its central directory is only parsed once.
+	# ZipFile serializes the raw reads of its shared file handle internally, which makes
+	# concurrent read() calls from several threads safe.
+	with open_archive_file(file_path) as archive, zipfile.ZipFile(archive, 'r') as zf:
+		members = [
+			info for info in zf.infolist()
+			if not info.is_dir()
+			and is_image_file(info.filename)
+			and not is_ignored_member(info.filename)
+		]
+		
+		# Naturally sorted by name
+		members.sort(key=lambda info: NATSORT_KEY(info.filename))
+		
+		# zlib releases the GIL while inflating, so the members are decompressed in parallel.
+		# map() preserves the input order, keeping the page sequence intact.
+		with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+			buffers = executor.map(lambda member: io.BytesIO(zf.read(member)), members)
+			yield from zip((member.filename for member in members), buffers)
+
+
+def iter_rar_images(file_path: str) -> Iterator[tuple[str, io.BytesIO]]:
+	"""
+	Reads the images of a CBR archive into memory.
+	rarfile spawns the UnRAR tool for every single member it reads (re-decompressing solid archives
+	from the start each time), so the archive is still extracted once into a temporary folder.
+	
+	Args:
+		file_path (str): The absolute path to the archive.
+		
+	Yields:
+		tuple[str, io.BytesIO]: The image path inside the archive and its content, in natural order.
+	"""
+	with tempfile.TemporaryDirectory() as temp_dir:
+		with rarfile.RarFile(file_path, 'r') as rf:
+			rf.extractall(temp_dir)
+		
+		for image_path in find_images_recursively(temp_dir):
+			with open(image_path, 'rb') as f:
+				yield os.path.relpath(image_path, temp_dir), io.BytesIO(f.read())
+
+
+# Image reader for each supported archive extension, new formats only need to be registered here
+ARCHIVE_READERS = {
+	'.cbz': iter_zip_images,
+	'.cbr': iter_rar_images,
+}
+
+
+def iter_archive_images(file_path: str) -> Iterator[tuple[str, io.BytesIO]]:
+	"""
+	Reads the images of a CBZ or CBR archive into memory, according to its extension.
+	
+	Args:
+		file_path (str): The absolute path to the archive.
+		
+	Yields:
+		tuple[str, io.BytesIO]: The image path inside the archive and its content, in natural order.
+	"""
+	reader = ARCHIVE_READERS.get(os.path.splitext(file_path)[1].lower())
+	if reader:
+		yield from reader(file_path)
 
 
 def find_images_recursively(root_folder: str) -> list:
@@ -136,100 +326,275 @@ def find_images_recursively(root_folder: str) -> list:
 		list: A naturally sorted list of absolute paths to the found images.
 	"""
 	image_files = []
+	pending_folders = [root_folder]
+
+	# Iterative descent with os.scandir(): the entry type comes from the directory listing
+	# itself, avoiding the extra stat() call per entry that os.walk() relies on
+	while pending_folders:
+		with os.scandir(pending_folders.pop()) as entries:
+			for entry in entries:
+				if entry.is_dir(follow_symlinks=False):
+					# Prune ignored directories before descending into them
+					if entry.name.lower() not in IGNORED_FOLDERS:
+						pending_folders.append(entry.path)
+				elif entry.is_file(follow_symlinks=False) and is_image_file(entry.name):
+					image_files.append(entry.path)
+	
+	# Returns the list naturally sorted (e.g., page_2.jpg before page_10.jpg)
+	return sorted(image_files, key=NATSORT_KEY)
+
+
+def get_jpeg_size(data: memoryview) -> tuple[int, int] | None:
+	"""
+	Reads the dimensions of a JPEG straight from its Start Of Frame segment, walking the
+	segment headers without invoking libjpeg or decoding any scan data.
+	Only 8-bit frames with 1, 3 or 4 components whose headers run up to the start of the scan
+	are reported, so anything img2pdf could not embed is left to Pillow's validation.
+	
+	Args:
+		data (memoryview): The raw bytes of the image.
+		
+	Returns:
+		tuple[int, int] | None: The (width, height) of the JPEG, or None if the data is not a JPEG
+		or its dimensions could not be determined from the header.
+	"""
+	if data[:3] != b'\xff\xd8\xff':
+		return None
+
+	size = None
+	offset = 2
+	while offset + 4 <= len(data):
+		if data[offset] != 0xFF:
+			return None
+		
+		marker = data[offset + 1]
+		if marker == 0xFF:
+			# Fill byte preceding a marker
+			offset += 1
+		elif marker == 0x01 or 0xD0 <= marker <= 0xD8:
+			# Standalone markers (TEM, RSTn, SOI) carry no length field
+			offset += 2
+		elif marker == 0xDA:
+			# Start of the scan data: the headers are complete
+			return size
+		elif marker == 0xD9:
+			# End of image before any scan data
+			return None
+		else:
+			(segment_length,) = struct.unpack_from('>H', data, offset + 2)
+			if marker in JPEG_SOF_MARKERS:
+				if offset + 10 > len(data):
+					return None
+				precision = data[offset + 4]
+				height, width = struct.unpack_from('>HH', data, offset + 5)
+				components = data[offset + 9]
+				# A height of 0 means it is only defined later, in a DNL segment
+				if precision != 8 or components not in (1, 3, 4) or not height:
+					return None
+				size = (width, height)
+			offset += 2 + segment_length
+	return None
+
+
+if NUMBA_AVAILABLE:
+	@njit(cache=True, nogil=True)
+	def blend_rgba_on_white(rgba: 'np.ndarray') -> 'np.ndarray':
+		"""
+		Composites an RGBA pixel array onto a white background in a single pass.
+		Compiled by Numba; nogil lets the page conversion threads run it concurrently.
+		
+		Args:
+			rgba (np.ndarray): A (height, width, 4) uint8 array.
+			
+		Returns:
+			np.ndarray: A (height, width, 3) uint8 array with the flattened pixels.
+		"""
+		height, width = rgba.shape[0], rgba.shape[1]
+		pixels = rgba.reshape(height * width * 4)
+		rgb = np.empty(height * width * 3, dtype=np.uint8)
+		for i in range(height * width):
+			alpha = np.uint32(pixels[4 * i + 3])
+			white = np.uint32(255) * (np.uint32(255) - alpha) + np.uint32(128)
+			for c in range(3):
+				# color * alpha + white * (1 - alpha), divided by 255 with the same rounding as Pillow
+				value = np.uint32(pixels[4 * i + c]) * alpha + white
+				rgb[3 * i + c] = ((value >> 8) + value) >> 8
+		return rgb.reshape(height, width, 3)
+
+
+def flatten_on_white(img: Image.Image) -> Image.Image:
+	"""
+	Flattens a transparent image onto a white background.
+	Uses the Numba kernel when available, otherwise falls back to Pillow's masked paste.
+	
+	Args:
+		img (Image.Image): An image in RGBA, LA or transparent palette mode.
+		
+	Returns:
+		Image.Image: The flattened RGB image.
+	"""
+	if img.mode != 'RGBA':
+		img = img.convert('RGBA')
+	
+	if NUMBA_AVAILABLE:
+		return Image.fromarray(blend_rgba_on_white(np.asarray(img)))
+	
+	bg = Image.new('RGB', img.size, (255, 255, 255))
+	bg.paste(img, mask=img.split()[3])
+	return bg
+
 
-	for root, dirs, files in os.walk(root_folder):
-		# Modifying dirs in-place to prune ignored directories from os.walk
-		dirs[:] = [d for d in dirs if d.lower() not in IGNORED_FOLDERS]
+def is_embeddable(img: Image.Image) -> bool:
+	"""
+	Checks whether img2pdf can embed an already properly-sized image as-is.
+	Only the header is needed for this check, no pixel data is decoded.
+	
+	Args:
+		img (Image.Image): The opened original image.
 		
-		for file in files:
-			if file.lower().endswith(IMAGE_EXTENSIONS) and not file.startswith('._'):
-				complete_path = os.path.join(root, file)
-				image_files.append(complete_path)
+	Returns:
+		bool: True if the original file can be handed to img2pdf unchanged.
+	"""
+	# img2pdf embeds the JPEG stream verbatim (RGB, grayscale or CMYK), without re-encoding
+	if img.format == 'JPEG':
+		return True
 	
-	# Returns the list naturally sorted (e.g., page_2.jpg before page_10.jpg)
-	return natsorted(image_files)
+	# RGB and grayscale PNGs, as well as opaque palette and bilevel ones, are embedded verbatim too
+	if img.format == 'PNG':
+		return img.mode in ['RGB', 'L'] or (img.mode in ['P', '1'] and 'transparency' not in img.info)
+	
+	# Single-page TIFFs are embedded natively (CCITT streams as-is, the others losslessly)
+	if img.format == 'TIFF':
+		return img.mode in ['RGB', 'L', '1', 'CMYK'] and getattr(img, 'n_frames', 1) == 1
+	
+	return False
 
 
-def convert_image_to_compatible(image_path: str) -> str | None:
+def save_to_buffer(img: Image.Image, image_format: str, **save_params) -> io.BytesIO:
+	"""
+	Encodes an image into a new in-memory buffer, so converted pages never touch the disk.
+	
+	Args:
+		img (Image.Image): The image to be encoded.
+		image_format (str): The Pillow format name (e.g., 'JPEG' or 'PNG').
+		**save_params: Encoder options forwarded to Image.save().
+		
+	Returns:
+		io.BytesIO: The encoded image, rewound and ready to be read by img2pdf.
+	"""
+	buffer = io.BytesIO()
+	img.save(buffer, image_format, **save_params)
+	buffer.seek(0)
+	return buffer
+
+
+def convert_image_to_compatible(image_name: str, image: io.BytesIO) -> io.BytesIO | None:
 	"""
 	Ensures an image is strictly compatible with the PDF specification.
 	Resizes excessively large images to maintain a consistent reading experience
-	and converts unsupported formats to RGB JPEGs.
+	and converts unsupported formats to RGB or grayscale JPEGs (transparent PNGs become paletted PNGs).
 	
 	Args:
-		image_path (str): The absolute path to the original image.
+		image_name (str): The image path inside the archive, used for logging.
+		image (io.BytesIO): The in-memory content of the original image.
 		
 	Returns:
-		str | None: The path to the compatible image, or None if the image is corrupted.
+		io.BytesIO | None: The original buffer (rewound) if it is already compatible, a new buffer
+		with the converted image, or None if the image is corrupted.
 	"""
 	try:
-		with Image.open(image_path) as img:
+		# Fast path for the most common page: an in-bounds JPEG is identified from its header bytes
+		# alone and passed through untouched, without even opening it with Pillow
+		with image.getbuffer() as data:
+			jpeg_size = get_jpeg_size(data)
+		
+		if jpeg_size and jpeg_size[0] <= MAX_IMAGE_SIZE[0] and jpeg_size[1] <= MAX_IMAGE_SIZE[1]:
+			image.seek(0)
+			return image
+		
+		with Image.open(image) as img:
 			# Check if the image exceeds the defined bounding box in any dimension
 			needs_resize = img.width > MAX_IMAGE_SIZE[0] or img.height > MAX_IMAGE_SIZE[1]
 			
 			# Optimization: Skip processing if it's already a standard, properly-sized image
-			if not needs_resize and img.format in ['JPEG', 'PNG'] and img.mode in ['RGB', 'L']:
-				return image_path
+			if not needs_resize and is_embeddable(img):
+				image.seek(0)
+				return image
+			
+			# Shrink-on-load: oversized JPEGs are decoded by libjpeg at 1/2, 1/4 or 1/8 scale
+			# (never below the final size), leaving only a small fractional resize for LANCZOS
+			if needs_resize and img.format == 'JPEG':
+				ratio = min(MAX_IMAGE_SIZE[0] / img.width, MAX_IMAGE_SIZE[1] / img.height)
+				img.draft('RGB', (int(img.width * ratio), int(img.height * ratio)))
+				needs_resize = img.width > MAX_IMAGE_SIZE[0] or img.height > MAX_IMAGE_SIZE[1]
 			
-			new_path = os.path.splitext(image_path)[0] + ".temp.jpg"
+			is_transparent_png = img.format == 'PNG' and (
+				img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info)
+			)
 			
 			# Handle transparency by flattening the image onto a white background
 			if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
-				bg = Image.new('RGB', img.size, (255, 255, 255))
-				if img.mode != 'RGBA':
-					img = img.convert('RGBA')
-				bg.paste(img, mask=img.split()[3])
-				img = bg  # Reassign to apply further transformations
-			else:
+				img = flatten_on_white(img)  # Reassign to apply further transformations
+			elif img.mode != 'L':
+				# Grayscale pages stay single-channel, a much smaller JPEG than its RGB equivalent
 				img = img.convert('RGB')
 				
 			# Apply resizing if necessary
 			if needs_resize:
 				# thumbnail() modifies the image in-place, strictly preserving aspect ratio.
 				# LANCZOS is used to prevent Moiré patterns in comic book halftones.
-				img.thumbnail(MAX_IMAGE_SIZE, Image.Resampling.LANCZOS)
+				# reducing_gap lets Pillow box-reduce large downscales by an integer factor first,
+				# while always leaving at least a 2x step for LANCZOS, so halftones stay clean.
+				img.thumbnail(MAX_IMAGE_SIZE, Image.Resampling.LANCZOS, reducing_gap=2.0)
 			
-			img.save(new_path, quality=90)
-			return new_path
+			if is_transparent_png:
+				# Transparent PNGs (typically flat-colored line art) are reduced to a 256-color palette
+				# instead of going through a JPEG round trip. img2pdf embeds the paletted PNG stream
+				# verbatim, so its size is what ends up in the PDF. Smooth gradients may show some
+				# banding, which the default Floyd-Steinberg dithering softens.
+				return save_to_buffer(img.quantize(method=Image.Quantize.FASTOCTREE), 'PNG')
+			
+			# 4:2:0 chroma subsampling suits comic art (few sharp color edges), and the extra
+			# Huffman optimization pass is skipped to keep encoding fast
+			return save_to_buffer(img, 'JPEG', quality=85, subsampling=2, optimize=False, progressive=False)
 	except Exception as e:
-		log_msg(f"  [WARNING] Corrupted or invalid image ignored: {os.path.basename(image_path)} - {e}", 'error')
+		log_msg(f"  [WARNING] Corrupted or invalid image ignored: {os.path.basename(image_name)} - {e}", 'warning')
 		return None
 
 
-def create_pdf(image_list: list, pdf_out_path: str) -> bool:
+def create_pdf(image_list: list[tuple[str, io.BytesIO]], pdf_out_path: str) -> bool:
 	"""
-	Compiles a list of processed image paths into a single PDF file.
+	Compiles a list of in-memory images into a single PDF file.
+	The list is consumed: it is emptied once its pages are handed to the converter threads, so
+	the original buffers of re-encoded pages are released before the PDF is assembled.
 	
 	Args:
-		image_list (list): A list containing paths to the images.
+		image_list (list[tuple[str, io.BytesIO]]): The (image name, image buffer) pairs, in page order.
+			The list is empty when the function returns.
 		pdf_out_path (str): The destination path for the generated PDF.
 		
 	Returns:
 		bool: True if the PDF was created successfully, False otherwise.
 	"""
-	final_images = []
+	# Prepare and validate all images before conversion.
+	# Pillow releases the GIL while decoding, resizing and encoding, so pages are converted
+	# concurrently. The futures are kept in input order, keeping the page sequence intact.
+	with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+		futures = [executor.submit(convert_image_to_compatible, name, image) for name, image in image_list]
+		# From here on each original buffer is only referenced by its pending conversion
+		image_list.clear()
+		final_images = [img for img in (future.result() for future in futures) if img]
+	del futures
 	
-	# Prepare and validate all images before conversion
-	for img_path in image_list:
-		compatible_img = convert_image_to_compatible(img_path)
-		if compatible_img:
-			final_images.append(compatible_img)
-			
 	if not final_images:
 		return False
 
 	try:
-		# Convert images to PDF bytes
-		pdf_bytes = img2pdf.convert(final_images)
-		
-		# Pylance Type Safety: Explicit check to assure pdf_bytes is not None
-		if pdf_bytes is not None:
-			with open(pdf_out_path, "wb") as f:
-				f.write(pdf_bytes)
-			return True
-		else:
-			log_msg(f"  [ERROR] Internal img2pdf conversion returned null for '{os.path.basename(pdf_out_path)}'.", 'error')
-			return False
+		# Stream the PDF straight into the output file instead of building the whole document
+		# as a single bytes object in memory first
+		with open(pdf_out_path, "wb") as f:
+			img2pdf.convert(final_images, outputstream=f)
+		return True
 			
 	except Exception as e:
 		log_msg(f"  [ERROR] Failed saving PDF '{os.path.basename(pdf_out_path)}': {e}", 'error')
@@ -249,30 +614,75 @@ def process_file(filename: str) -> None:
 	pdf_name = os.path.splitext(filename)[0] + ".pdf"
 	pdf_path = os.path.join(CURRENT_DIR, pdf_name)
 
-	with tempfile.TemporaryDirectory() as temp_dir:
-		# 1. Extraction Phase
-		if not extract_files(file_path, temp_dir):
-			return
+	# 1. Extraction Phase (images are read straight into memory)
+	try:
+		images = list(iter_archive_images(file_path))
+	except Exception as e:
+		log_msg(f"  [ERROR] Failed extracting '{filename}': {e}", 'error')
+		return
+	
+	if not images:
+		log_msg(f"  [ERROR] No images found inside '{filename}' (Verify if the archive is empty).", 'error')
+		return
 
-		# 2. Deep Scan Phase
-		images = find_images_recursively(temp_dir)
-		
-		if not images:
-			log_msg(f"  [ERROR] No images found inside '{filename}' (Verify if the archive is empty).", 'error')
-			return
+	log_msg(f"  -> Found {len(images)} images (Structure: {os.path.dirname(images[0][0]) or '.'})")
 
-		log_msg(f"  -> Found {len(images)} images (Structure: {os.path.dirname(images[0])})")
+	# 2. PDF Generation Phase
+	success = create_pdf(images, pdf_path)
+
+	# 3. Cleanup and Archiving Phase
+	if success:
+		try:
+			archived_path = os.path.join(OLD_DIR, filename)
+			try:
+				# Atomic rename on the same filesystem, a single directory entry update
+				os.replace(file_path, archived_path)
+			except OSError:
+				# Cross-device move, falls back to copying the archive
+				shutil.move(file_path, archived_path)
+			log_msg(f"  [SUCCESS] '{pdf_name}' successfully created.")
+		except Exception as e:
+			log_msg(f"  [ERROR] PDF created, but failed to move the original archive: {e}", 'error')
 
-		# 3. PDF Generation Phase
-		success = create_pdf(images, pdf_path)
 
-		# 4. Cleanup and Archiving Phase
-		if success:
+def run_process_pool(archives: list[str], max_workers: int, log_queue: multiprocessing.Queue, pbar: tqdm) -> list[str]:
+	"""
+	Converts the given archives on a pool of worker processes.
+	
+	Args:
+		archives (list[str]): The file names of the archives to convert.
+		max_workers (int): The number of worker processes.
+		log_queue (multiprocessing.Queue): The queue the workers send their log records to.
+		pbar (tqdm): The progress bar, advanced for every archive that was handled.
+		
+	Returns:
+		list[str]: The archives left unprocessed because a worker process died and broke the pool.
+	"""
+	# The cores left over by the process pool go to the page threads of each worker
+	# (e.g., a single archive on 8 cores gets 8 threads, 8 archives get 2 threads each)
+	threads_per_worker = max(2, min(8, (os.cpu_count() or 1) // max_workers))
+	unprocessed = []
+
+	with ProcessPoolExecutor(
+		max_workers=max_workers,
+		initializer=init_worker,
+		initargs=(log_queue, threads_per_worker)
+	) as executor:
+		futures = {executor.submit(process_file, archive): archive for archive in archives}
+		
+		for future in as_completed(futures):
+			archive = futures[future]
 			try:
-				shutil.move(file_path, os.path.join(OLD_DIR, filename))
-				log_msg(f"  [SUCCESS] '{pdf_name}' successfully created.")
+				future.result()
+			except BrokenProcessPool:
+				unprocessed.append(archive)
+				continue
 			except Exception as e:
-				log_msg(f"  [ERROR] PDF created, but failed to move the original archive: {e}", 'error')
+				log_msg(f"  [ERROR] Unexpected failure while processing '{archive}': {e}", 'error')
+			pbar.set_description(f"Finished {archive[:15]}...")
+			pbar.update(1)
+	
+	return unprocessed
 
 
 def main() -> None:
@@ -280,8 +690,9 @@ def main() -> None:
 	Main entry point. Orchestrates the batch processing of all archives in the directory.
 	"""
 	setup_folders()
+	check_pillow_simd()
 	
-	archives = [f for f in os.listdir(CURRENT_DIR) if f.lower().endswith(('.cbz', '.cbr'))]
+	archives = [f for f in os.listdir(CURRENT_DIR) if os.path.splitext(f)[1].lower() in ARCHIVE_READERS]
 	
 	if not archives:
 		print("No .cbz or .cbr files found in the current directory.")
@@ -290,18 +701,46 @@ def main() -> None:
 	print(f"Starting processing of {len(archives)} files...")
 	print("=" * 60)
 
-	with tqdm(total=len(archives), unit="vol") as pbar:
-		for archive in archives:
-			pbar.set_description(f"Processing {archive[:15]}...")
-			process_file(archive)
-			pbar.update(1)
+	log_queue = multiprocessing.Queue()
+	file_handler = logging.FileHandler(LOG_FILE)
+	file_handler.setFormatter(LOG_FORMATTER)
+	# Records are buffered and written in batches; errors flush the buffer right away
+	memory_handler = logging.handlers.MemoryHandler(capacity=1000, flushLevel=logging.ERROR, target=file_handler)
+	listener = logging.handlers.QueueListener(log_queue, memory_handler)
+	listener.start()
+	setup_logging(log_queue)
+	
+	# Freeze the startup heap before forking, so the workers inherit it outside the collector's scans
+	gc.freeze()
+
+	# Each archive uses its own buffers and output PDF, so they can be processed independently
+	max_workers = min(len(archives), os.cpu_count() or 1)
+
+	try:
+		with tqdm(total=len(archives), unit="vol") as pbar:
+			unprocessed = run_process_pool(archives, max_workers, log_queue, pbar)
 			
-			# Explicit garbage collection to free memory after heavy image processing
-			gc.collect()
+			# A worker killed by a signal (e.g., SIGBUS on an I/O error in a memory-mapped archive)
+			# breaks the whole pool. The archives it took down are retried on a pool of their own,
+			# so a faulty archive can only fail itself.
+			for archive in unprocessed:
+				if not os.path.exists(os.path.join(CURRENT_DIR, archive)):
+					# Already converted and archived, the pool broke before reporting it
+					pbar.update(1)
+				elif run_process_pool([archive], 1, log_queue, pbar):
+					log_msg(f"  [ERROR] Worker process crashed while processing '{archive}'.", 'error')
+					pbar.update(1)
+	finally:
+		# Stopping the listener drains the queue, closing the memory handler flushes what is left
+		listener.stop()
+		memory_handler.close()
+		file_handler.close()
 
 	print("=" * 60)
 	print("Process finished. Check 'conversion_error_log.txt' in case of errors.")
 
 
 if __name__ == "__main__":
+	# Required for the worker processes when running as a bundled executable (PyInstaller)
+	multiprocessing.freeze_support()
 	main()
\ No newline at end of file